@@ -1,9 +1,172 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.stats import norm
-import pandas as pd
-from datetime import datetime, timedelta
+import functools
 import math
+import sys
+
+import _kernel
+import bscore_gpu
+import utils_math
+
+try:
+    import _bscore  # optional AVX2 extension; see _bscore.c for the build line
+except ImportError:
+    _bscore = None
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+
+def _ncdf(x):
+    """Standard normal CDF via math.erf, avoiding scipy dispatch overhead."""
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+def _npdf(x):
+    """Standard normal PDF, inlined for the scalar path."""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def _norm_inv_cdf(p):
+    """
+    Inverse of the standard normal CDF (quantile function).
+
+    Rational approximation from Wichura, M.J. (1988), "Algorithm AS241:
+    The Percentage Points of the Normal Distribution", Applied
+    Statistics 37(3) - the same algorithm CPython's statistics module
+    uses. Accurate to about 1e-15 without needing scipy's ppf dispatch.
+    """
+    if not 0.0 < p < 1.0:
+        raise ValueError("p must be in (0, 1)")
+
+    q = p - 0.5
+    if abs(q) <= 0.425:
+        r = 0.180625 - q * q
+        num = (((((((2.50908_09287_30122_6727e+3 * r +
+                     3.34305_75583_58812_8105e+4) * r +
+                     6.72657_70927_00870_0853e+4) * r +
+                     4.59219_53931_54987_1457e+4) * r +
+                     1.37316_93765_50946_1125e+4) * r +
+                     1.97159_09503_06551_4427e+3) * r +
+                     1.33141_66789_17843_7745e+2) * r +
+                     3.38713_28727_96366_6080e+0) * q
+        den = (((((((5.22649_52788_52854_5610e+3 * r +
+                     2.87290_85735_72194_2674e+4) * r +
+                     3.93078_95800_09271_0610e+4) * r +
+                     2.12137_94301_58659_5867e+4) * r +
+                     5.39419_60214_24751_1077e+3) * r +
+                     6.87187_00749_20579_0830e+2) * r +
+                     4.23133_30701_60091_1252e+1) * r +
+                     1.0)
+        return num / den
+
+    r = p if q <= 0.0 else 1.0 - p
+    r = math.sqrt(-math.log(r))
+    if r <= 5.0:
+        r = r - 1.6
+        num = (((((((7.74545_01427_83414_07640e-4 * r +
+                     2.27238_44989_26918_45833e-2) * r +
+                     2.41780_72517_74506_11770e-1) * r +
+                     1.27045_82524_52368_38258e+0) * r +
+                     3.64784_83247_63204_60504e+0) * r +
+                     5.76949_72214_60691_40550e+0) * r +
+                     4.63033_78461_56545_29590e+0) * r +
+                     1.42343_71107_49683_57734e+0)
+        den = (((((((1.05075_00716_44416_84324e-9 * r +
+                     5.47593_80849_95344_94600e-4) * r +
+                     1.51986_66563_61645_71966e-2) * r +
+                     1.48103_97642_74800_74590e-1) * r +
+                     6.89767_33498_51000_04550e-1) * r +
+                     1.67638_48301_83803_84940e+0) * r +
+                     2.05319_16266_37758_82187e+0) * r +
+                     1.0)
+    else:
+        r = r - 5.0
+        num = (((((((2.01033_43992_92288_13265e-7 * r +
+                     2.71155_55687_43487_57815e-5) * r +
+                     1.24266_09473_88078_43860e-3) * r +
+                     2.65321_89526_57612_30930e-2) * r +
+                     2.96560_57182_85048_91230e-1) * r +
+                     1.78482_65399_17291_33580e+0) * r +
+                     5.46378_49111_64114_36990e+0) * r +
+                     6.65790_46435_01103_77720e+0)
+        den = (((((((2.04426_31033_89939_78564e-15 * r +
+                     1.42151_17583_16445_88870e-7) * r +
+                     1.84631_83175_10054_68180e-5) * r +
+                     7.86869_13114_56132_59100e-4) * r +
+                     1.48753_61290_85061_48525e-2) * r +
+                     1.36929_88092_27358_05310e-1) * r +
+                     5.99832_20655_58879_37690e-1) * r +
+                     1.0)
+
+    x = num / den
+    return x if q > 0.0 else -x
+
+
+def _round12(x):
+    """Round to 12 significant digits so cache keys tolerate float noise."""
+    return float(f'{x:.12g}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _d1d2_cached(S, K, T, r, sigma, q):
+    sqrtT = math.sqrt(T)
+    v = sigma * sqrtT
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / v
+    return d1, d1 - v, sqrtT, v
+
+
+def _d1d2(S, K, T, r, sigma, q=0.0):
+    """
+    Calculate (d1, d2, sqrt(T), sigma*sqrt(T)), memoized across calls.
+
+    d1 and d2 are fused so sigma*sqrt(T) is computed once and handed
+    back for reuse (vega/gamma need it too). Scenario sweeps and
+    interactive what-ifs revisit the same parameter combinations
+    constantly, so repeated evaluations become dict lookups. Keys are
+    rounded to 12 significant digits to keep float noise from
+    defeating the cache.
+    """
+    if T == 0:
+        d1 = 0 if S == K else (float('inf') if S > K else float('-inf'))
+        return d1, d1, 0.0, 0.0
+    if sigma <= 0:
+        # Zero volatility: the forward either finishes in the money or
+        # it doesn't, so d1/d2 collapse to +/-inf and N(d) to 0/1,
+        # which reproduces the discounted intrinsic value exactly.
+        m = math.log(S / K) + (r - q) * T
+        d1 = 0.0 if m == 0 else math.copysign(math.inf, m)
+        return d1, d1, math.sqrt(T), 0.0
+    return _d1d2_cached(_round12(S), _round12(K), _round12(T),
+                        _round12(r), _round12(sigma), _round12(q))
+
+
+@functools.lru_cache(maxsize=4096)
+def _disc_cached(rate, T):
+    return math.exp(-rate * T)
+
+
+def _disc(rate, T):
+    """Memoized discount factor exp(-rate*T); same key rounding as _d1d2."""
+    return _disc_cached(_round12(rate), _round12(T))
+
+
+def _compute_shared(S, K, T, r, sigma, q=0.0):
+    """
+    Compute the intermediates shared by a call and a put on the same terms.
+
+    Call and put share d1, d2, N(d1), N(d2), n(d1) and both discount
+    factors, so callers comparing the two (put-call parity) only need one
+    set of transcendental evaluations. d1/d2 come from _d1d2, which also
+    supplies the limiting values for expired or zero-vol inputs.
+
+    Returns:
+    --------
+    tuple
+        (d1, d2, Nd1, Nd2, nd1, disc_q, disc_r, sqrtT)
+    """
+    d1, d2, sqrtT, _ = _d1d2(S, K, T, r, sigma, q)
+    return (d1, d2, _ncdf(d1), _ncdf(d2), _npdf(d1),
+            math.exp(-q * T), math.exp(-r * T), sqrtT)
 
 
 class BlackScholesCalculator:
@@ -12,8 +175,17 @@ class BlackScholesCalculator:
 
     This class implements the Black-Scholes-Merton model for European options
     and calculates all major Greeks (Delta, Gamma, Theta, Vega, Rho).
+
+    Construction actually hands back one of two specialized subclasses
+    (_CallBS / _PutBS), so the option-type branch is decided once here
+    instead of inside every Greek on every call.
     """
 
+    def __new__(cls, S, K, T, r, sigma, option_type='call', q=0.0):
+        if cls is BlackScholesCalculator:
+            cls = _CallBS if option_type.lower() == 'call' else _PutBS
+        return super().__new__(cls)
+
     def __init__(self, S, K, T, r, sigma, option_type='call', q=0.0):
         """
         Initialize the Black-Scholes calculator.
@@ -43,94 +215,403 @@ class BlackScholesCalculator:
         self.option_type = option_type.lower()
         self.q = q
 
-        # Calculate d1 and d2
-        self.d1 = self._calculate_d1()
-        self.d2 = self._calculate_d2()
+        # Calculate d1 and d2 (memoized across instances); sqrt(T) and
+        # sigma*sqrt(T) fall out of the same fused computation.
+        self.d1, self.d2, self._sqrtT, self._v = _d1d2(S, K, T, r, sigma, q)
 
-    def _calculate_d1(self):
-        """Calculate d1 parameter for Black-Scholes formula."""
-        if self.T == 0:
-            return 0 if self.S == self.K else (float('inf') if self.S > self.K else float('-inf'))
+        # Cache the expensive transcendentals once; every Greek reuses them
+        # instead of recomputing exp/cdf/pdf per call.
+        self._disc_q = _disc(self.q, self.T)
+        self._disc_r = _disc(self.r, self.T)
+        self._Nd1 = _ncdf(self.d1)
+        self._Nd2 = _ncdf(self.d2)
+        self._Nmd1 = 1.0 - self._Nd1
+        self._Nmd2 = 1.0 - self._Nd2
+        self._nd1 = _npdf(self.d1)
+        self._logSK = None  # filled lazily by update()
+        self._price = None
 
-        return (np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma ** 2) * self.T) / (
-                    self.sigma * np.sqrt(self.T))
+    def update(self, **kwargs):
+        """
+        Patch parameters in place, recomputing only what they affect.
 
-    def _calculate_d2(self):
-        """Calculate d2 parameter for Black-Scholes formula."""
-        if self.T == 0:
-            return self.d1
-        return self.d1 - self.sigma * np.sqrt(self.T)
+        Accepts S, K, T, r, sigma, q and option_type. Cheaper than
+        building a new calculator for interactive what-ifs: a
+        sigma-only change reuses the cached log(S/K), sqrt(T) and both
+        discount factors; an S-only change reuses sqrt(T) and the
+        discount factors; and so on. Returns self for chaining.
+        """
+        allowed = ('S', 'K', 'T', 'r', 'sigma', 'q', 'option_type')
+        for name in kwargs:
+            if name not in allowed:
+                raise TypeError(f"update() got an unexpected parameter {name!r}")
 
-    def option_price(self):
-        """Calculate the option price using Black-Scholes formula."""
-        if self.T == 0:
-            # At expiration
-            if self.option_type == 'call':
-                return max(self.S - self.K, 0)
-            else:
-                return max(self.K - self.S, 0)
+        option_type = kwargs.pop('option_type', None)
+        if option_type is not None and option_type.lower() != self.option_type:
+            self.option_type = option_type.lower()
+            self.__class__ = _CallBS if self.option_type == 'call' else _PutBS
+            self._price = None
 
-        if self.option_type == 'call':
-            price = (self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1) -
-                     self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2))
-        else:
-            price = (self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2) -
-                     self.S * np.exp(-self.q * self.T) * norm.cdf(-self.d1))
+        changed = {name for name, value in kwargs.items()
+                   if value != getattr(self, name)}
+        if not changed:
+            return self
+        for name in changed:
+            setattr(self, name, kwargs[name])
 
-        return price
+        if self.T == 0 or self.sigma <= 0:
+            # Expiration or zero vol collapses d1/d2 to their limits;
+            # take the full __init__ path, which handles both.
+            self.__init__(self.S, self.K, self.T, self.r, self.sigma,
+                          self.option_type, self.q)
+            return self
 
-    def delta(self):
-        """Calculate Delta - sensitivity to underlying price changes."""
-        if self.T == 0:
-            if self.option_type == 'call':
-                return 1.0 if self.S > self.K else 0.0
-            else:
-                return -1.0 if self.S < self.K else 0.0
+        if self._logSK is None or 'S' in changed or 'K' in changed:
+            self._logSK = math.log(self.S / self.K)
+        if 'T' in changed:
+            self._sqrtT = math.sqrt(self.T)
+        if 'T' in changed or 'sigma' in changed:
+            self._v = self.sigma * self._sqrtT
+        if 'q' in changed or 'T' in changed:
+            self._disc_q = _disc(self.q, self.T)
+        if 'r' in changed or 'T' in changed:
+            self._disc_r = _disc(self.r, self.T)
 
-        if self.option_type == 'call':
-            return np.exp(-self.q * self.T) * norm.cdf(self.d1)
-        else:
-            return -np.exp(-self.q * self.T) * norm.cdf(-self.d1)
+        # d1/d2 and the cached values that hang off them always move.
+        self.d1 = (self._logSK +
+                   (self.r - self.q + 0.5 * self.sigma * self.sigma) * self.T) / self._v
+        self.d2 = self.d1 - self._v
+        self._Nd1 = _ncdf(self.d1)
+        self._Nd2 = _ncdf(self.d2)
+        self._Nmd1 = 1.0 - self._Nd1
+        self._Nmd2 = 1.0 - self._Nd2
+        self._nd1 = _npdf(self.d1)
+        self._price = None
+        return self
 
     def gamma(self):
         """Calculate Gamma - rate of change of Delta."""
-        if self.T == 0:
+        if self._v == 0:  # expired or zero volatility
             return 0.0
 
-        return (np.exp(-self.q * self.T) * norm.pdf(self.d1)) / (self.S * self.sigma * np.sqrt(self.T))
+        return (self._disc_q * self._nd1) / (self.S * self._v)
 
-    def theta(self):
-        """Calculate Theta - time decay."""
+    def vega(self):
+        """Calculate Vega - sensitivity to volatility changes."""
         if self.T == 0:
             return 0.0
 
-        if self.option_type == 'call':
-            theta = (-(self.S * np.exp(-self.q * self.T) * norm.pdf(self.d1) * self.sigma) / (2 * np.sqrt(self.T)) +
-                     self.q * self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1) -
-                     self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2))
+        return self.S * self._disc_q * self._nd1 * self._sqrtT / 100
+
+    @classmethod
+    def vectorized(cls, S, K, T, r, sigma, option_type='call', q=0.0,
+                   dtype=np.float64, log_SK=None):
+        """
+        Calculate prices and Greeks for whole parameter sweeps at once.
+
+        Accepts array-like (or scalar) inputs for S, K, T, r, sigma and q,
+        broadcasts them against each other and evaluates the Black-Scholes
+        formulas with a single vectorized pass instead of building one
+        calculator object per point.
+
+        Callers that already know the log-moneyness (e.g. a spot sweep,
+        where log(m*S/K) = log(S/K) + log(m) turns the per-point logs
+        into adds) can pass it as log_SK to skip the np.log entirely.
+
+        Passing dtype=np.float32 halves memory traffic and doubles SIMD
+        throughput for big sweeps, at the cost of single-precision
+        accuracy (roughly 4-6 significant digits) - plenty for risk
+        scans, not for anything needing exact parity checks.
+
+        Returns:
+        --------
+        dict
+            Same keys as get_all_greeks(), but each value is a NumPy array.
+        """
+        S, K, T, r, sigma, q = np.broadcast_arrays(
+            *np.atleast_1d(S, K, T, r, sigma, np.asarray(q, dtype=float)))
+        option_type = option_type.lower()
+
+        # Branchless expiration handling: clamp T so the live-value
+        # formulas stay finite, compute everything unconditionally, then
+        # overwrite the expired entries with terminal payoffs at the end.
+        # This lets one kernel pass handle mixed expiring/live options.
+        # The clamp values are float32-safe: sigma*sqrt(T) must neither
+        # flush to zero nor push d1*d1 past float32 overflow, since the
+        # clamped rows' kernel output is discarded but still computed.
+        expired = T <= 0
+        has_expired = bool(expired.any())
+        if has_expired:
+            T = np.where(expired, 1e-12, T)
+
+        # Zero-vol rows get the same treatment: clamp sigma so no
+        # backend divides by zero (fastmath kernels turn the resulting
+        # inf into garbage), then overwrite those rows with the
+        # limiting values below - the vectorized twin of _d1d2's
+        # sigma <= 0 branch. Expired zero-vol rows are clamped too
+        # (the expired merge rewrites them) but excluded from the mask.
+        sigma_floor = sigma <= 0
+        zero_vol = sigma_floor & ~expired
+        has_zero_vol = bool(zero_vol.any())
+        if sigma_floor.any():
+            sigma = np.where(sigma_floor, 1e-6, sigma)
+
+        if log_SK is not None:
+            log_SK = np.broadcast_to(np.asarray(log_SK, dtype=float), S.shape)
+
+        if dtype == np.float32:
+            res = cls._vectorized_f32(S, K, T, r, sigma, q, option_type, log_SK)
+        elif _kernel.HAVE_NUMBA and log_SK is None:
+            # The JIT-compiled batch kernel runs the whole sweep without
+            # Python dispatch (and in parallel across cores).
+            shape = S.shape
+            flat = [np.ascontiguousarray(a, dtype=np.float64).ravel()
+                    for a in (S, K, T, r, sigma, q)]
+            out = _kernel.price_greeks_batch(*flat, option_type == 'call')
+            res = {name: out[:, i].reshape(shape)
+                   for i, name in enumerate(
+                       ('Price', 'Delta', 'Gamma', 'Theta', 'Vega', 'Rho'))}
         else:
-            theta = (-(self.S * np.exp(-self.q * self.T) * norm.pdf(self.d1) * self.sigma) / (2 * np.sqrt(self.T)) -
-                     self.q * self.S * np.exp(-self.q * self.T) * norm.cdf(-self.d1) +
-                     self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2))
+            res = cls._vectorized_numpy(S, K, T, r, sigma, q, option_type, log_SK)
 
-        return theta / 365  # Convert to per-day theta
+        if has_expired:
+            out_dtype = res['Price'].dtype
+            if option_type == 'call':
+                payoff = np.maximum(S - K, 0.0)
+                terminal_delta = np.where(S > K, 1.0, 0.0)
+            else:
+                payoff = np.maximum(K - S, 0.0)
+                terminal_delta = np.where(S < K, -1.0, 0.0)
+            payoff = payoff.astype(out_dtype, copy=False)
+            terminal_delta = terminal_delta.astype(out_dtype, copy=False)
+            res['Price'] = np.where(expired, payoff, res['Price'])
+            res['Delta'] = np.where(expired, terminal_delta, res['Delta'])
+            for name in ('Gamma', 'Theta', 'Vega', 'Rho'):
+                res[name] = np.where(expired, 0.0, res[name])
 
-    def vega(self):
-        """Calculate Vega - sensitivity to volatility changes."""
-        if self.T == 0:
-            return 0.0
+        if has_zero_vol:
+            out_dtype = res['Price'].dtype
+            disc_q = np.exp(-q * T)
+            disc_r = np.exp(-r * T)
+            # Sign of the forward moneyness decides everything: N(d1)
+            # and N(d2) both collapse to this step function.
+            m = (log_SK if log_SK is not None else np.log(S / K)) + (r - q) * T
+            Nd = np.where(m > 0, 1.0, np.where(m < 0, 0.0, 0.5))
+            if option_type == 'call':
+                price = Nd * (S * disc_q - K * disc_r)
+                delta = disc_q * Nd
+                theta = (q * S * disc_q - r * K * disc_r) * Nd / 365
+                rho = K * T * disc_r * Nd / 100
+            else:
+                Nmd = 1.0 - Nd
+                price = Nmd * (K * disc_r - S * disc_q)
+                delta = -disc_q * Nmd
+                theta = (r * K * disc_r - q * S * disc_q) * Nmd / 365
+                rho = -K * T * disc_r * Nmd / 100
+            for name, value in (('Price', price), ('Delta', delta),
+                                ('Theta', theta), ('Rho', rho)):
+                res[name] = np.where(zero_vol, value.astype(out_dtype, copy=False),
+                                     res[name])
+            for name in ('Gamma', 'Vega'):
+                res[name] = np.where(zero_vol, 0.0, res[name])
 
-        return self.S * np.exp(-self.q * self.T) * norm.pdf(self.d1) * np.sqrt(self.T) / 100
+        return res
 
-    def rho(self):
-        """Calculate Rho - sensitivity to interest rate changes."""
-        if self.T == 0:
-            return 0.0
+    @classmethod
+    def _vectorized_numpy(cls, S, K, T, r, sigma, q, option_type, log_SK=None):
+        """Plain-NumPy float64 implementation behind vectorized()."""
+        if log_SK is None:
+            log_SK = np.log(S / K)
+        sqrtT = np.sqrt(T)
+        v = sigma * sqrtT
+        d1 = (log_SK + (r - q + 0.5 * sigma * sigma) * T) / v
+        d2 = d1 - v
 
-        if self.option_type == 'call':
-            return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(self.d2) / 100
+        Nd1 = utils_math.ncdf(d1)
+        Nd2 = utils_math.ncdf(d2)
+        nd1 = utils_math.npdf(d1)
+        disc_q = np.exp(-q * T)
+        disc_r = np.exp(-r * T)
+
+        if option_type == 'call':
+            price = S * disc_q * Nd1 - K * disc_r * Nd2
+            delta = disc_q * Nd1
+            theta = (-(S * disc_q * nd1 * sigma) / (2 * sqrtT) +
+                     q * S * disc_q * Nd1 -
+                     r * K * disc_r * Nd2)
+            rho = K * T * disc_r * Nd2 / 100
         else:
-            return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-self.d2) / 100
+            price = K * disc_r * (1 - Nd2) - S * disc_q * (1 - Nd1)
+            delta = -disc_q * (1 - Nd1)
+            theta = (-(S * disc_q * nd1 * sigma) / (2 * sqrtT) -
+                     q * S * disc_q * (1 - Nd1) +
+                     r * K * disc_r * (1 - Nd2))
+            rho = -K * T * disc_r * (1 - Nd2) / 100
+
+        return {
+            'Price': price,
+            'Delta': delta,
+            'Gamma': disc_q * nd1 / (S * v),
+            'Theta': theta / 365,
+            'Vega': S * disc_q * nd1 * sqrtT / 100,
+            'Rho': rho
+        }
+
+    @classmethod
+    def _vectorized_f32(cls, S, K, T, r, sigma, q, option_type, log_SK=None):
+        """
+        Single-precision implementation behind vectorized(dtype=float32).
+
+        utils_math keeps its constants as plain Python floats, so the
+        whole computation stays in single precision end to end.
+        """
+        S, K, T, r, sigma, q = (np.ascontiguousarray(a, dtype=np.float32)
+                                for a in (S, K, T, r, sigma, q))
+        if log_SK is None:
+            log_SK = np.log(S / K)
+        else:
+            log_SK = np.asarray(log_SK, dtype=np.float32)
+
+        sqrtT = np.sqrt(T)
+        v = sigma * sqrtT
+        d1 = (log_SK + (r - q + 0.5 * sigma * sigma) * T) / v
+        d2 = d1 - v
+
+        Nd1 = utils_math.ncdf(d1)
+        Nd2 = utils_math.ncdf(d2)
+        nd1 = np.float32(_INV_SQRT_2PI) * np.exp(-0.5 * d1 * d1)
+        disc_q = np.exp(-q * T)
+        disc_r = np.exp(-r * T)
+
+        if option_type == 'call':
+            price = S * disc_q * Nd1 - K * disc_r * Nd2
+            delta = disc_q * Nd1
+            theta = (-(S * disc_q * nd1 * sigma) / (2 * sqrtT) +
+                     q * S * disc_q * Nd1 -
+                     r * K * disc_r * Nd2)
+            rho = K * T * disc_r * Nd2 / 100
+        else:
+            price = K * disc_r * (1 - Nd2) - S * disc_q * (1 - Nd1)
+            delta = -disc_q * (1 - Nd1)
+            theta = (-(S * disc_q * nd1 * sigma) / (2 * sqrtT) -
+                     q * S * disc_q * (1 - Nd1) +
+                     r * K * disc_r * (1 - Nd2))
+            rho = -K * T * disc_r * (1 - Nd2) / 100
+
+        return {
+            'Price': price,
+            'Delta': delta,
+            'Gamma': disc_q * nd1 / (S * v),
+            'Theta': theta / 365,
+            'Vega': S * disc_q * nd1 * sqrtT / 100,
+            'Rho': rho
+        }
+
+    @classmethod
+    def price_batch(cls, S, K, T, r, sigma, option_type='call', q=0.0):
+        """
+        Price a whole book of options at once (prices only, no Greeks).
+
+        When the optional _bscore AVX2 extension is built and the batch
+        holds at least 8 options, pricing runs 8-wide on float32 data
+        (accurate to float32 rounding, i.e. a few 1e-4 in price units).
+        That suits bulk risk scans; callers needing full float64
+        accuracy (or Greeks) should use vectorized() instead, which is
+        also the fallback here.
+        """
+        S, K, T, r, sigma, q = np.broadcast_arrays(
+            *np.atleast_1d(S, K, T, r, sigma, np.asarray(q, dtype=float)))
+        if _bscore is not None and S.size >= 8:
+            is_call = option_type.lower() == 'call'
+            expired = T <= 0
+            has_expired = expired.any()
+            if has_expired:
+                # The branch-free SIMD loop would turn T == 0 into NaN
+                # (rsqrt(0) -> inf); clamp those rows and merge the
+                # terminal payoff back, mirroring vectorized().
+                T = np.where(expired, 1e-30, T)
+            # Same story for sigma <= 0: the kernel divides by
+            # sigma*sqrt(T), so clamp and merge the zero-vol limit
+            # (discounted intrinsic value), like vectorized() does.
+            sigma_floor = sigma <= 0
+            zero_vol = sigma_floor & ~expired
+            has_zero_vol = zero_vol.any()
+            if sigma_floor.any():
+                sigma = np.where(sigma_floor, 1e-6, sigma)
+            flat = [np.ascontiguousarray(a, dtype=np.float32).ravel()
+                    for a in (S, K, T, r, sigma, q)]
+            out = np.empty(S.size, dtype=np.float32)
+            _bscore.bs_price_batch(*flat, out, is_call)
+            out = out.reshape(S.shape)
+            if has_expired:
+                payoff = np.maximum(S - K, 0.0) if is_call else np.maximum(K - S, 0.0)
+                out = np.where(expired, payoff.astype(np.float32), out)
+            if has_zero_vol:
+                fwd = S * np.exp(-q * T) - K * np.exp(-r * T)
+                limit = np.maximum(fwd if is_call else -fwd, 0.0)
+                out = np.where(zero_vol, limit.astype(np.float32), out)
+            return out
+        return cls.vectorized(S, K, T, r, sigma, option_type, q)['Price']
+
+    @classmethod
+    def price_batch_gpu(cls, S, K, T, r, sigma, option_type='call', q=0.0):
+        """
+        Price a whole book of options on the GPU (prices only).
+
+        Requires CuPy and a CUDA device; worthwhile from roughly 1e5
+        options, below which the transfer cost dominates and
+        price_batch/vectorized are faster. Returns a float32 CuPy array
+        on the device - call .get() to copy prices back to host.
+        """
+        S, K, T, r, sigma, q = np.broadcast_arrays(
+            *np.atleast_1d(S, K, T, r, sigma, np.asarray(q, dtype=float)))
+        out = bscore_gpu.price_batch_gpu(
+            S.ravel(), K.ravel(), T.ravel(), r.ravel(), sigma.ravel(),
+            q.ravel(), option_type.lower() == 'call')
+        return out.reshape(S.shape)
+
+    def implied_volatility(self, market_price, tol=1e-8, max_iter=100):
+        """
+        Solve for the volatility implied by an observed market price.
+
+        Uses Newton-Raphson with the analytic vega as the derivative,
+        seeded with the Brenner-Subrahmanyam approximation. Since price
+        is monotone in volatility, a bracket is maintained and the
+        solver falls back to bisection whenever vega is too small for a
+        useful Newton step (deep in/out-of-the-money options). Raises
+        ValueError if the option is at expiration or the solver fails
+        to converge (e.g. the price is outside no-arbitrage bounds).
+        """
+        if self.T == 0:
+            raise ValueError("implied volatility is undefined at expiration")
+        if market_price <= 0:
+            raise ValueError("market price must be positive")
+
+        # Brenner-Subrahmanyam: sigma ~ price/S * sqrt(2*pi/T)
+        sigma = max(market_price / self.S * math.sqrt(2 * math.pi / self.T), 1e-4)
+        lo, hi = 1e-6, 5.0
+
+        for _ in range(max_iter):
+            calc = BlackScholesCalculator(self.S, self.K, self.T, self.r,
+                                          sigma, self.option_type, self.q)
+            diff = calc.option_price() - market_price
+            if diff > 0:
+                hi = min(hi, sigma)
+            else:
+                lo = max(lo, sigma)
+
+            vega = calc.S * calc._disc_q * calc._nd1 * calc._sqrtT  # per unit vol
+            new_sigma = sigma - diff / vega if vega > 1e-12 else None
+            if new_sigma is None or not lo < new_sigma < hi:
+                new_sigma = 0.5 * (lo + hi)  # bisect when Newton misbehaves
+            if abs(new_sigma - sigma) < tol:
+                if abs(diff) > 1e-6 * max(1.0, market_price):
+                    break  # pinned at a bracket edge: price unattainable
+                return new_sigma
+            sigma = new_sigma
+
+        raise ValueError(f"implied volatility did not converge for "
+                         f"price {market_price}")
 
     def get_all_greeks(self):
         """Return all Greeks in a dictionary."""
@@ -145,44 +626,48 @@ class BlackScholesCalculator:
 
     def summary(self):
         """Print a comprehensive summary of the option and its Greeks."""
-        print("=" * 60)
-        print("BLACK-SCHOLES OPTION PRICING SUMMARY")
-        print("=" * 60)
-        print(f"Option Type: {self.option_type.upper()}")
-        print(f"Current Stock Price (S): ${self.S:.2f}")
-        print(f"Strike Price (K): ${self.K:.2f}")
-        print(f"Time to Expiration (T): {self.T:.4f} years")
-        print(f"Risk-free Rate (r): {self.r:.2%}")
-        print(f"Volatility (σ): {self.sigma:.2%}")
-        print(f"Dividend Yield (q): {self.q:.2%}")
-        print("-" * 60)
-        print("OPTION PRICING RESULTS:")
-        print("-" * 60)
+        # Build the report in memory and write it in one go: one stdout
+        # call instead of ~20 keeps summaries cheap inside tight loops.
+        lines = [
+            "=" * 60,
+            "BLACK-SCHOLES OPTION PRICING SUMMARY",
+            "=" * 60,
+            f"Option Type: {self.option_type.upper()}",
+            f"Current Stock Price (S): ${self.S:.2f}",
+            f"Strike Price (K): ${self.K:.2f}",
+            f"Time to Expiration (T): {self.T:.4f} years",
+            f"Risk-free Rate (r): {self.r:.2%}",
+            f"Volatility (σ): {self.sigma:.2%}",
+            f"Dividend Yield (q): {self.q:.2%}",
+            "-" * 60,
+            "OPTION PRICING RESULTS:",
+            "-" * 60,
+        ]
 
         greeks = self.get_all_greeks()
         for name, value in greeks.items():
             if name == 'Price':
-                print(f"{name}: ${value:.4f}")
+                lines.append(f"{name}: ${value:.4f}")
             elif name == 'Delta':
-                print(f"{name}: {value:.4f} (${value * 100:.2f} per $1 move)")
+                lines.append(f"{name}: {value:.4f} (${value * 100:.2f} per $1 move)")
             elif name == 'Gamma':
-                print(f"{name}: {value:.6f} (Delta change per $1 move)")
+                lines.append(f"{name}: {value:.6f} (Delta change per $1 move)")
             elif name == 'Theta':
-                print(f"{name}: {value:.4f} (${value:.4f} per day)")
+                lines.append(f"{name}: {value:.4f} (${value:.4f} per day)")
             elif name == 'Vega':
-                print(f"{name}: {value:.4f} (per 1% volatility change)")
+                lines.append(f"{name}: {value:.4f} (per 1% volatility change)")
             elif name == 'Rho':
-                print(f"{name}: {value:.4f} (per 1% rate change)")
+                lines.append(f"{name}: {value:.4f} (per 1% rate change)")
 
-        print("-" * 60)
+        lines.append("-" * 60)
 
         # Moneyness analysis
         if self.S > self.K:
-            print(f"Option is IN-THE-MONEY (S > K)")
+            lines.append("Option is IN-THE-MONEY (S > K)")
         elif self.S < self.K:
-            print(f"Option is OUT-OF-THE-MONEY (S < K)")
+            lines.append("Option is OUT-OF-THE-MONEY (S < K)")
         else:
-            print(f"Option is AT-THE-MONEY (S = K)")
+            lines.append("Option is AT-THE-MONEY (S = K)")
 
         # Intrinsic and Time Value
         if self.option_type == 'call':
@@ -192,6 +677,151 @@ class BlackScholesCalculator:
 
         time_value = self.option_price() - intrinsic_value
 
-        print(f"Intrinsic Value: ${intrinsic_value:.4f}")
-        print(f"Time Value: ${time_value:.4f}")
-        print("=" * 60)
+        lines.append(f"Intrinsic Value: ${intrinsic_value:.4f}")
+        lines.append(f"Time Value: ${time_value:.4f}")
+        lines.append("=" * 60)
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+class _CallBS(BlackScholesCalculator):
+    """Call-specialized calculator; the option-type branch is compiled out."""
+
+    def option_price(self):
+        """Calculate the option price using Black-Scholes formula (cached)."""
+        if self._price is None:
+            if self.T == 0:
+                self._price = max(self.S - self.K, 0)  # At expiration
+            else:
+                self._price = (self.S * self._disc_q * self._Nd1 -
+                               self.K * self._disc_r * self._Nd2)
+        return self._price
+
+    def delta(self):
+        """Calculate Delta - sensitivity to underlying price changes."""
+        if self.T == 0:
+            return 1.0 if self.S > self.K else 0.0
+        return self._disc_q * self._Nd1
+
+    def theta(self):
+        """Calculate Theta - time decay."""
+        if self.T == 0:
+            return 0.0
+        theta = (-(self.S * self._disc_q * self._nd1 * self.sigma) / (2 * self._sqrtT) +
+                 self.q * self.S * self._disc_q * self._Nd1 -
+                 self.r * self.K * self._disc_r * self._Nd2)
+        return theta / 365  # Convert to per-day theta
+
+    def rho(self):
+        """Calculate Rho - sensitivity to interest rate changes."""
+        if self.T == 0:
+            return 0.0
+        return self.K * self.T * self._disc_r * self._Nd2 / 100
+
+
+class _PutBS(BlackScholesCalculator):
+    """Put-specialized calculator; the option-type branch is compiled out."""
+
+    def option_price(self):
+        """Calculate the option price using Black-Scholes formula (cached)."""
+        if self._price is None:
+            if self.T == 0:
+                self._price = max(self.K - self.S, 0)  # At expiration
+            else:
+                self._price = (self.K * self._disc_r * self._Nmd2 -
+                               self.S * self._disc_q * self._Nmd1)
+        return self._price
+
+    def delta(self):
+        """Calculate Delta - sensitivity to underlying price changes."""
+        if self.T == 0:
+            return -1.0 if self.S < self.K else 0.0
+        return -self._disc_q * self._Nmd1
+
+    def theta(self):
+        """Calculate Theta - time decay."""
+        if self.T == 0:
+            return 0.0
+        theta = (-(self.S * self._disc_q * self._nd1 * self.sigma) / (2 * self._sqrtT) -
+                 self.q * self.S * self._disc_q * self._Nmd1 +
+                 self.r * self.K * self._disc_r * self._Nmd2)
+        return theta / 365  # Convert to per-day theta
+
+    def rho(self):
+        """Calculate Rho - sensitivity to interest rate changes."""
+        if self.T == 0:
+            return 0.0
+        return -self.K * self.T * self._disc_r * self._Nmd2 / 100
+
+
+class OptionBook:
+    """
+    Structure-of-arrays container for a book of European options.
+
+    Instead of one Python object per option (each with its own __dict__
+    and ~100 bytes of overhead), the book keeps contiguous float64
+    arrays for S, K, T, r, sigma and q plus a uint8 is_call mask, so
+    bulk pricing feeds the vectorized kernels cache-friendly columns
+    and mixed call/put books price in one pass.
+    """
+
+    def __init__(self, S, K, T, r, sigma, q=0.0, is_call=True):
+        S, K, T, r, sigma, q, is_call = np.broadcast_arrays(
+            *np.atleast_1d(S, K, T, r, sigma, q, is_call))
+        self.S = np.ascontiguousarray(S, dtype=np.float64)
+        self.K = np.ascontiguousarray(K, dtype=np.float64)
+        self.T = np.ascontiguousarray(T, dtype=np.float64)
+        self.r = np.ascontiguousarray(r, dtype=np.float64)
+        self.sigma = np.ascontiguousarray(sigma, dtype=np.float64)
+        self.q = np.ascontiguousarray(q, dtype=np.float64)
+        self.is_call = np.ascontiguousarray(is_call, dtype=np.uint8)
+
+    def __len__(self):
+        return self.S.size
+
+    def greeks(self, log_SK=None):
+        """
+        Price the whole book; returns the get_all_greeks() dict with an
+        array per entry.
+
+        Prices every row as a call in one vectorized pass, then rewrites
+        the put rows in place via put-call parity (put price, delta,
+        theta and rho are cheap linear corrections of the call values;
+        gamma and vega are shared outright). log_SK optionally supplies
+        precomputed per-row log-moneyness (see vectorized()).
+        """
+        res = BlackScholesCalculator.vectorized(
+            self.S, self.K, self.T, self.r, self.sigma, 'call', self.q,
+            log_SK=log_SK)
+
+        puts = self.is_call == 0
+        if puts.any():
+            disc_q = np.exp(-self.q * self.T)
+            disc_r = np.exp(-self.r * self.T)
+            live = self.T > 0
+
+            pm = puts & live
+            res['Price'] = np.where(
+                pm, res['Price'] - self.S * disc_q + self.K * disc_r, res['Price'])
+            res['Delta'] = np.where(pm, res['Delta'] - disc_q, res['Delta'])
+            res['Theta'] = np.where(
+                pm,
+                res['Theta'] + (self.r * self.K * disc_r - self.q * self.S * disc_q) / 365,
+                res['Theta'])
+            res['Rho'] = np.where(
+                pm, res['Rho'] - self.K * self.T * disc_r / 100, res['Rho'])
+
+            pe = puts & ~live
+            if pe.any():
+                # Expired puts need their own terminal payoff/delta;
+                # the other Greeks are already zeroed on expired rows.
+                res['Price'] = np.where(
+                    pe, np.maximum(self.K - self.S, 0.0), res['Price'])
+                res['Delta'] = np.where(
+                    pe, np.where(self.S < self.K, -1.0, 0.0), res['Delta'])
+
+        return res
+
+    def price(self):
+        """Prices for the whole book (array, same order as the inputs)."""
+        return self.greeks()['Price']
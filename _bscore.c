@@ -0,0 +1,276 @@
+/*
+ * Optional AVX2/FMA batch pricing kernel for the Black-Scholes calculator.
+ *
+ * Exposes one function:
+ *
+ *     _bscore.bs_price_batch(S, K, T, r, sigma, q, out, is_call)
+ *
+ * where S, K, T, r, sigma, q are C-contiguous float32 buffers of equal
+ * length, out is a writable float32 buffer of the same length that
+ * receives the option prices, and is_call selects call/put.
+ *
+ * The normal CDF uses the Abramowitz-Stegun 7.1.26 rational erf
+ * approximation (max erf error 1.5e-7), which is SIMD-friendly because
+ * it only needs one exp, one division and a degree-5 polynomial per
+ * lane. Prices come out accurate to float32 rounding, good enough for
+ * bulk risk scans but not a replacement for the float64 Greeks path.
+ *
+ * Build (the module is optional; everything falls back to NumPy when
+ * the .so is absent):
+ *
+ *     cc -shared -fPIC -O3 -mavx2 -mfma -ffast-math \
+ *        $(python3-config --includes) _bscore.c -lm -o _bscore.so
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <immintrin.h>
+#include <math.h>
+
+/* Abramowitz-Stegun 7.1.26 erf constants. */
+#define AS_P 0.3275911f
+#define AS_A1 0.254829592f
+#define AS_A2 (-0.284496736f)
+#define AS_A3 1.421413741f
+#define AS_A4 (-1.453152027f)
+#define AS_A5 1.061405429f
+#define INV_SQRT_2 0.707106781f
+
+/* ------------------------------------------------------------------ */
+/* 8-wide exp/log, Cephes-style polynomials (as in avx_mathfun.h).     */
+/* ------------------------------------------------------------------ */
+
+static inline __m256 exp256_ps(__m256 x)
+{
+    const __m256 hi = _mm256_set1_ps(88.3762626647949f);
+    const __m256 lo = _mm256_set1_ps(-88.3762626647949f);
+    const __m256 log2e = _mm256_set1_ps(1.44269504088896341f);
+    const __m256 c1 = _mm256_set1_ps(0.693359375f);
+    const __m256 c2 = _mm256_set1_ps(-2.12194440e-4f);
+    const __m256 one = _mm256_set1_ps(1.0f);
+
+    x = _mm256_min_ps(_mm256_max_ps(x, lo), hi);
+
+    __m256 fx = _mm256_fmadd_ps(x, log2e, _mm256_set1_ps(0.5f));
+    fx = _mm256_floor_ps(fx);
+    x = _mm256_fnmadd_ps(fx, c1, x);
+    x = _mm256_fnmadd_ps(fx, c2, x);
+
+    __m256 z = _mm256_mul_ps(x, x);
+    __m256 y = _mm256_set1_ps(1.9875691500e-4f);
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(1.3981999507e-3f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(8.3334519073e-3f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(4.1665795894e-2f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(1.6666665459e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(5.0000001201e-1f));
+    y = _mm256_fmadd_ps(y, z, _mm256_add_ps(x, one));
+
+    __m256i n = _mm256_cvttps_epi32(fx);
+    n = _mm256_add_epi32(n, _mm256_set1_epi32(0x7f));
+    n = _mm256_slli_epi32(n, 23);
+    return _mm256_mul_ps(y, _mm256_castsi256_ps(n));
+}
+
+static inline __m256 log256_ps(__m256 x)
+{
+    const __m256 one = _mm256_set1_ps(1.0f);
+    const __m256i mant_mask = _mm256_set1_epi32(~0x7f800000);
+
+    /* Inputs here are S/K > 0, so skip the <= 0 masking. */
+    x = _mm256_max_ps(x, _mm256_castsi256_ps(_mm256_set1_epi32(0x00800000)));
+
+    __m256i imm = _mm256_srli_epi32(_mm256_castps_si256(x), 23);
+    imm = _mm256_sub_epi32(imm, _mm256_set1_epi32(0x7f));
+    __m256 e = _mm256_add_ps(_mm256_cvtepi32_ps(imm), one);
+
+    x = _mm256_and_ps(x, _mm256_castsi256_ps(mant_mask));
+    x = _mm256_or_ps(x, _mm256_set1_ps(0.5f));
+
+    __m256 mask = _mm256_cmp_ps(x, _mm256_set1_ps(0.707106781f), _CMP_LT_OQ);
+    __m256 tmp = _mm256_and_ps(x, mask);
+    x = _mm256_sub_ps(x, one);
+    e = _mm256_sub_ps(e, _mm256_and_ps(one, mask));
+    x = _mm256_add_ps(x, tmp);
+
+    __m256 z = _mm256_mul_ps(x, x);
+    __m256 y = _mm256_set1_ps(7.0376836292e-2f);
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(-1.1514610310e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(1.1676998740e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(-1.2420140846e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(1.4249322787e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(-1.6668057665e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(2.0000714765e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(-2.4999993993e-1f));
+    y = _mm256_fmadd_ps(y, x, _mm256_set1_ps(3.3333331174e-1f));
+    y = _mm256_mul_ps(_mm256_mul_ps(y, x), z);
+
+    y = _mm256_fmadd_ps(e, _mm256_set1_ps(-2.12194440e-4f), y);
+    y = _mm256_fnmadd_ps(z, _mm256_set1_ps(0.5f), y);
+    x = _mm256_add_ps(x, y);
+    return _mm256_fmadd_ps(e, _mm256_set1_ps(0.693359375f), x);
+}
+
+/* ------------------------------------------------------------------ */
+/* Normal CDF via Abramowitz-Stegun 7.1.26 erf.                        */
+/* ------------------------------------------------------------------ */
+
+static inline __m256 ncdf256_ps(__m256 x)
+{
+    const __m256 one = _mm256_set1_ps(1.0f);
+    const __m256 sign_bit = _mm256_set1_ps(-0.0f);
+
+    __m256 z = _mm256_mul_ps(x, _mm256_set1_ps(INV_SQRT_2));
+    __m256 sign = _mm256_and_ps(z, sign_bit);
+    __m256 az = _mm256_andnot_ps(sign_bit, z);
+
+    __m256 t = _mm256_div_ps(one, _mm256_fmadd_ps(_mm256_set1_ps(AS_P),
+                                                  az, one));
+    __m256 poly = _mm256_set1_ps(AS_A5);
+    poly = _mm256_fmadd_ps(poly, t, _mm256_set1_ps(AS_A4));
+    poly = _mm256_fmadd_ps(poly, t, _mm256_set1_ps(AS_A3));
+    poly = _mm256_fmadd_ps(poly, t, _mm256_set1_ps(AS_A2));
+    poly = _mm256_fmadd_ps(poly, t, _mm256_set1_ps(AS_A1));
+    poly = _mm256_mul_ps(poly, t);
+
+    __m256 e = exp256_ps(_mm256_sub_ps(_mm256_setzero_ps(),
+                                       _mm256_mul_ps(az, az)));
+    __m256 erfv = _mm256_fnmadd_ps(poly, e, one);
+    erfv = _mm256_or_ps(erfv, sign);
+    return _mm256_mul_ps(_mm256_set1_ps(0.5f), _mm256_add_ps(one, erfv));
+}
+
+static float ncdf_scalar(float x)
+{
+    float z = x * INV_SQRT_2;
+    float az = fabsf(z);
+    float t = 1.0f / (1.0f + AS_P * az);
+    float poly = ((((AS_A5 * t + AS_A4) * t + AS_A3) * t + AS_A2) * t + AS_A1) * t;
+    float erfv = 1.0f - poly * expf(-az * az);
+    if (z < 0.0f)
+        erfv = -erfv;
+    return 0.5f * (1.0f + erfv);
+}
+
+/* ------------------------------------------------------------------ */
+/* Batch pricing entry point.                                          */
+/* ------------------------------------------------------------------ */
+
+static void price_range(const float *S, const float *K, const float *T,
+                        const float *r, const float *sigma, const float *q,
+                        float *out, Py_ssize_t n, int is_call)
+{
+    const __m256 half = _mm256_set1_ps(0.5f);
+    const __m256 one = _mm256_set1_ps(1.0f);
+    const __m256 three_halves = _mm256_set1_ps(1.5f);
+    Py_ssize_t i = 0;
+
+    for (; i + 8 <= n; i += 8) {
+        __m256 s = _mm256_loadu_ps(S + i);
+        __m256 k = _mm256_loadu_ps(K + i);
+        __m256 t = _mm256_loadu_ps(T + i);
+        __m256 rr = _mm256_loadu_ps(r + i);
+        __m256 qq = _mm256_loadu_ps(q + i);
+        __m256 sg = _mm256_loadu_ps(sigma + i);
+
+        /* 1/sqrt(T) via rsqrt plus one Newton step. */
+        __m256 rs = _mm256_rsqrt_ps(t);
+        rs = _mm256_mul_ps(rs, _mm256_fnmadd_ps(
+            _mm256_mul_ps(half, t), _mm256_mul_ps(rs, rs), three_halves));
+        __m256 sqrtT = _mm256_mul_ps(t, rs);
+
+        __m256 drift = _mm256_mul_ps(
+            _mm256_add_ps(_mm256_sub_ps(rr, qq),
+                          _mm256_mul_ps(half, _mm256_mul_ps(sg, sg))), t);
+        __m256 d1 = _mm256_div_ps(
+            _mm256_mul_ps(_mm256_add_ps(log256_ps(_mm256_div_ps(s, k)), drift),
+                          rs), sg);
+        __m256 d2 = _mm256_fnmadd_ps(sg, sqrtT, d1);
+
+        __m256 disc_q = exp256_ps(
+            _mm256_sub_ps(_mm256_setzero_ps(), _mm256_mul_ps(qq, t)));
+        __m256 disc_r = exp256_ps(
+            _mm256_sub_ps(_mm256_setzero_ps(), _mm256_mul_ps(rr, t)));
+        __m256 nd1 = ncdf256_ps(d1);
+        __m256 nd2 = ncdf256_ps(d2);
+
+        __m256 price;
+        if (is_call) {
+            price = _mm256_fmsub_ps(
+                _mm256_mul_ps(s, disc_q), nd1,
+                _mm256_mul_ps(_mm256_mul_ps(k, disc_r), nd2));
+        } else {
+            price = _mm256_fmsub_ps(
+                _mm256_mul_ps(k, disc_r), _mm256_sub_ps(one, nd2),
+                _mm256_mul_ps(_mm256_mul_ps(s, disc_q),
+                              _mm256_sub_ps(one, nd1)));
+        }
+        _mm256_storeu_ps(out + i, price);
+    }
+
+    for (; i < n; i++) {
+        float sqrtT = sqrtf(T[i]);
+        float v = sigma[i] * sqrtT;
+        float d1 = (logf(S[i] / K[i]) +
+                    (r[i] - q[i] + 0.5f * sigma[i] * sigma[i]) * T[i]) / v;
+        float d2 = d1 - v;
+        float disc_q = expf(-q[i] * T[i]);
+        float disc_r = expf(-r[i] * T[i]);
+        if (is_call)
+            out[i] = S[i] * disc_q * ncdf_scalar(d1) -
+                     K[i] * disc_r * ncdf_scalar(d2);
+        else
+            out[i] = K[i] * disc_r * (1.0f - ncdf_scalar(d2)) -
+                     S[i] * disc_q * (1.0f - ncdf_scalar(d1));
+    }
+}
+
+static PyObject *bs_price_batch(PyObject *self, PyObject *args)
+{
+    Py_buffer bufs[7];
+    int is_call;
+
+    if (!PyArg_ParseTuple(args, "y*y*y*y*y*y*w*p",
+                          &bufs[0], &bufs[1], &bufs[2], &bufs[3],
+                          &bufs[4], &bufs[5], &bufs[6], &is_call))
+        return NULL;
+
+    Py_ssize_t n = bufs[0].len / (Py_ssize_t)sizeof(float);
+    for (int j = 0; j < 7; j++) {
+        if (bufs[j].len != n * (Py_ssize_t)sizeof(float)) {
+            for (int m = 0; m < 7; m++)
+                PyBuffer_Release(&bufs[m]);
+            PyErr_SetString(PyExc_ValueError,
+                            "all buffers must be float32 and equal length");
+            return NULL;
+        }
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    price_range((const float *)bufs[0].buf, (const float *)bufs[1].buf,
+                (const float *)bufs[2].buf, (const float *)bufs[3].buf,
+                (const float *)bufs[4].buf, (const float *)bufs[5].buf,
+                (float *)bufs[6].buf, n, is_call);
+    Py_END_ALLOW_THREADS
+
+    for (int j = 0; j < 7; j++)
+        PyBuffer_Release(&bufs[j]);
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef bscore_methods[] = {
+    {"bs_price_batch", bs_price_batch, METH_VARARGS,
+     "bs_price_batch(S, K, T, r, sigma, q, out, is_call)\n"
+     "Fill `out` with Black-Scholes prices for float32 input buffers."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef bscore_module = {
+    PyModuleDef_HEAD_INIT, "_bscore",
+    "AVX2 batch Black-Scholes pricing kernel.", -1, bscore_methods
+};
+
+PyMODINIT_FUNC PyInit__bscore(void)
+{
+    return PyModule_Create(&bscore_module);
+}
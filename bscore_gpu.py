@@ -0,0 +1,69 @@
+"""
+Optional CUDA batch pricing kernel for the Black-Scholes calculator.
+
+Pricing a large option book is embarrassingly parallel, so for big
+batches (roughly 1e5 options and up) the float32 kernel below beats any
+CPU path once the data is on the device. CuPy is optional: when it is
+not installed, importing this module still works and price_batch_gpu
+raises a clear error if called.
+"""
+
+import numpy as np
+
+try:
+    import cupy as cp
+    HAVE_CUPY = True
+except ImportError:
+    HAVE_CUPY = False
+
+_KERNEL_SRC = r'''
+extern "C" __global__
+void bs_price(const float* S, const float* K, const float* T,
+              const float* r, const float* sigma, const float* q,
+              float* out, int is_call, int n)
+{
+    int i = blockIdx.x * blockDim.x + threadIdx.x;
+    if (i >= n) return;
+
+    float sqrtT = sqrtf(T[i]);
+    float v = sigma[i] * sqrtT;
+    float d1 = (__logf(S[i] / K[i]) +
+                (r[i] - q[i] + 0.5f * sigma[i] * sigma[i]) * T[i]) / v;
+    float d2 = d1 - v;
+    float disc_q = __expf(-q[i] * T[i]);
+    float disc_r = __expf(-r[i] * T[i]);
+
+    /* normcdff is the device intrinsic for the standard normal CDF. */
+    if (is_call)
+        out[i] = S[i] * disc_q * normcdff(d1) - K[i] * disc_r * normcdff(d2);
+    else
+        out[i] = K[i] * disc_r * (1.0f - normcdff(d2)) -
+                 S[i] * disc_q * (1.0f - normcdff(d1));
+}
+'''
+
+_BLOCK = 256
+
+if HAVE_CUPY:
+    _bs_price = cp.RawKernel(_KERNEL_SRC, 'bs_price')
+
+
+def price_batch_gpu(S, K, T, r, sigma, q, is_call):
+    """
+    Price a batch of options on the GPU.
+
+    All parameters are array-likes of equal length (host or device);
+    is_call selects call/put for the whole batch. Returns a float32
+    CuPy array on the device - call .get() to copy prices back to host.
+    """
+    if not HAVE_CUPY:
+        raise RuntimeError("cupy is not installed; GPU pricing is unavailable")
+
+    arrs = [cp.ascontiguousarray(cp.asarray(a, dtype=cp.float32))
+            for a in (S, K, T, r, sigma, q)]
+    n = arrs[0].size
+    out = cp.empty(n, dtype=cp.float32)
+    grid = ((n + _BLOCK - 1) // _BLOCK,)
+    _bs_price(grid, (_BLOCK,),
+              (*arrs, out, np.int32(is_call), np.int32(n)))
+    return out
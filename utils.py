@@ -1,5 +1,13 @@
-from BlackScholesCalc import BlackScholesCalculator
+from BlackScholesCalc import BlackScholesCalculator, OptionBook, _compute_shared
+import math
 import numpy as np
+import sys
+
+# Fixed spot-sweep grid for scenario_analysis. The logs are hoisted to
+# import time because log(m*S/K) = log(S/K) + log(m): one scalar log at
+# call time plus these constants replaces a log per sweep point.
+_SPOT_MULTS = np.array([0.9, 0.95, 1.0, 1.05, 1.1])
+_LOG_SPOT_MULTS = np.log(_SPOT_MULTS)
 
 def get_user_input():
     """
@@ -79,6 +87,23 @@ def run_interactive_calculator():
         calculator = BlackScholesCalculator(S, K, T, r, sigma, option_type, q)
         calculator.summary()
 
+        # Quick what-ifs: patch a single parameter in place instead of
+        # re-entering everything (update() only recomputes what changed)
+        while True:
+            tweak = input("\nChange a single parameter? (s/k/t/r/v/q, Enter to skip): ").lower()
+            if tweak not in ('s', 'k', 't', 'r', 'v', 'q'):
+                break
+            try:
+                value = float(input("   New value (T in years; r/v/q as %): "))
+            except ValueError:
+                print("Invalid input! Please enter a numeric value.")
+                continue
+            param = {'s': 'S', 'k': 'K', 't': 'T', 'r': 'r', 'v': 'sigma', 'q': 'q'}[tweak]
+            if param in ('r', 'sigma', 'q'):
+                value /= 100
+            calculator.update(**{param: value})
+            calculator.summary()
+
         # Ask if user wants to continue
         continue_choice = input("\nWould you like to calculate another option? (y/n): ").lower()
         if continue_choice != 'y':
@@ -91,82 +116,119 @@ def scenario_analysis(base_S, base_K, base_T, base_r, base_sigma, base_q, base_o
     """
     Perform comprehensive scenario analysis showing how Greeks change with different inputs.
     """
-    print("\n" + "=" * 80)
-    print("SCENARIO ANALYSIS: How Parameter Changes Affect Option Pricing")
-    print("=" * 80)
+    # Collect the whole report and write it once; a single stdout call
+    # is far cheaper than one per row when this runs in a loop.
+    lines = [
+        "\n" + "=" * 80,
+        "SCENARIO ANALYSIS: How Parameter Changes Affect Option Pricing",
+        "=" * 80,
+    ]
 
     # Base case
     base_calc = BlackScholesCalculator(base_S, base_K, base_T, base_r, base_sigma, base_option_type, base_q)
     base_greeks = base_calc.get_all_greeks()
 
-    print(f"\nBase Case Results:")
-    print(f"Stock: ${base_S}, Strike: ${base_K}, Time: {base_T:.3f}yr, Rate: {base_r:.1%}, Vol: {base_sigma:.1%}")
-    print(f"Option Price: ${base_greeks['Price']:.4f}")
+    lines.append(f"\nBase Case Results:")
+    lines.append(f"Stock: ${base_S}, Strike: ${base_K}, Time: {base_T:.3f}yr, Rate: {base_r:.1%}, Vol: {base_sigma:.1%}")
+    lines.append(f"Option Price: ${base_greeks['Price']:.4f}")
 
     # Scenario 1: Stock Price Changes
-    print(f"\n1. STOCK PRICE SENSITIVITY ANALYSIS:")
-    print(f"{'Stock Price':<12} {'Option Price':<12} {'Delta':<8} {'Gamma':<8}")
-    print("-" * 50)
-
-    for multiplier in [0.9, 0.95, 1.0, 1.05, 1.1]:
-        new_S = base_S * multiplier
-        calc = BlackScholesCalculator(new_S, base_K, base_T, base_r, base_sigma, base_option_type, base_q)
-        greeks = calc.get_all_greeks()
-        print(f"${new_S:<11.2f} ${greeks['Price']:<11.4f} {greeks['Delta']:<8.4f} {greeks['Gamma']:<8.6f}")
+    lines.append(f"\n1. STOCK PRICE SENSITIVITY ANALYSIS:")
+    lines.append(f"{'Stock Price':<12} {'Option Price':<12} {'Delta':<8} {'Gamma':<8}")
+    lines.append("-" * 50)
+
+    is_call = base_option_type.lower() == 'call'
+    new_S = base_S * _SPOT_MULTS
+    log_SK = math.log(base_S / base_K) + _LOG_SPOT_MULTS
+    greeks = OptionBook(new_S, base_K, base_T, base_r, base_sigma, base_q,
+                        is_call).greeks(log_SK=log_SK)
+    for i in range(len(new_S)):
+        lines.append(f"${new_S[i]:<11.2f} ${greeks['Price'][i]:<11.4f} {greeks['Delta'][i]:<8.4f} {greeks['Gamma'][i]:<8.6f}")
 
     # Scenario 2: Volatility Changes
-    print(f"\n2. VOLATILITY SENSITIVITY ANALYSIS:")
-    print(f"{'Volatility':<12} {'Option Price':<12} {'Vega':<8} {'Delta':<8}")
-    print("-" * 50)
+    lines.append(f"\n2. VOLATILITY SENSITIVITY ANALYSIS:")
+    lines.append(f"{'Volatility':<12} {'Option Price':<12} {'Vega':<8} {'Delta':<8}")
+    lines.append("-" * 50)
 
-    for vol_change in [-0.1, -0.05, 0.0, 0.05, 0.1]:
-        new_sigma = base_sigma + vol_change
-        if new_sigma > 0:  # Ensure positive volatility
-            calc = BlackScholesCalculator(base_S, base_K, base_T, base_r, new_sigma, base_option_type, base_q)
-            greeks = calc.get_all_greeks()
-            print(f"{new_sigma:<11.1%} ${greeks['Price']:<11.4f} {greeks['Vega']:<8.4f} {greeks['Delta']:<8.4f}")
+    new_sigma = base_sigma + np.array([-0.1, -0.05, 0.0, 0.05, 0.1])
+    new_sigma = new_sigma[new_sigma > 0]  # Ensure positive volatility
+    greeks = OptionBook(base_S, base_K, base_T, base_r, new_sigma, base_q, is_call).greeks()
+    for i in range(len(new_sigma)):
+        lines.append(f"{new_sigma[i]:<11.1%} ${greeks['Price'][i]:<11.4f} {greeks['Vega'][i]:<8.4f} {greeks['Delta'][i]:<8.4f}")
 
     # Scenario 3: Time Decay Analysis
-    print(f"\n3. TIME DECAY ANALYSIS:")
-    print(f"{'Days Left':<12} {'Option Price':<12} {'Theta':<8} {'Delta':<8}")
-    print("-" * 50)
+    lines.append(f"\n3. TIME DECAY ANALYSIS:")
+    lines.append(f"{'Days Left':<12} {'Option Price':<12} {'Theta':<8} {'Delta':<8}")
+    lines.append("-" * 50)
+
+    days = np.array([90, 60, 30, 15, 7])
+    new_T = days / 365
+    greeks = OptionBook(base_S, base_K, new_T, base_r, base_sigma, base_q, is_call).greeks()
+    for i in range(len(days)):
+        lines.append(f"{days[i]:<12} ${greeks['Price'][i]:<11.4f} {greeks['Theta'][i]:<8.4f} {greeks['Delta'][i]:<8.4f}")
 
-    for days in [90, 60, 30, 15, 7]:
-        new_T = days / 365
-        if new_T > 0:
-            calc = BlackScholesCalculator(base_S, base_K, new_T, base_r, base_sigma, base_option_type, base_q)
-            greeks = calc.get_all_greeks()
-            print(f"{days:<12} ${greeks['Price']:<11.4f} {greeks['Theta']:<8.4f} {greeks['Delta']:<8.4f}")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def compare_call_vs_put(S, K, T, r, sigma, q=0.0):
     """
     Compare call and put options side by side.
     """
-    print("\n" + "=" * 80)
-    print("CALL vs PUT COMPARISON")
-    print("=" * 80)
-
-    call_calc = BlackScholesCalculator(S, K, T, r, sigma, 'call', q)
-    put_calc = BlackScholesCalculator(S, K, T, r, sigma, 'put', q)
-
-    call_greeks = call_calc.get_all_greeks()
-    put_greeks = put_calc.get_all_greeks()
-
-    print(f"{'Metric':<15} {'Call Option':<15} {'Put Option':<15}")
-    print("-" * 50)
+    lines = [
+        "\n" + "=" * 80,
+        "CALL vs PUT COMPARISON",
+        "=" * 80,
+    ]
+
+    if T <= 0 or sigma <= 0:
+        # Expired or zero-vol comparisons collapse to intrinsic values
+        # and divide by zero in the shared formulas below; the scalar
+        # calculators already handle those limits, and the doubled cost
+        # is irrelevant off the hot path.
+        call_greeks = BlackScholesCalculator(S, K, T, r, sigma, 'call', q).get_all_greeks()
+        put_greeks = BlackScholesCalculator(S, K, T, r, sigma, 'put', q).get_all_greeks()
+        disc_r = math.exp(-r * T)
+    else:
+        # Call and put share d1/d2 and every transcendental, so compute them
+        # once and derive the put side from N(-x) = 1 - N(x) and parity.
+        d1, d2, Nd1, Nd2, nd1, disc_q, disc_r, sqrtT = _compute_shared(S, K, T, r, sigma, q)
+
+        call_price = S * disc_q * Nd1 - K * disc_r * Nd2
+        common_theta = -(S * disc_q * nd1 * sigma) / (2 * sqrtT)
+
+        call_greeks = {
+            'Price': call_price,
+            'Delta': disc_q * Nd1,
+            'Gamma': disc_q * nd1 / (S * sigma * sqrtT),
+            'Theta': (common_theta + q * S * disc_q * Nd1 - r * K * disc_r * Nd2) / 365,
+            'Vega': S * disc_q * nd1 * sqrtT / 100,
+            'Rho': K * T * disc_r * Nd2 / 100
+        }
+        put_greeks = {
+            'Price': call_price - S * disc_q + K * disc_r,  # put-call parity
+            'Delta': call_greeks['Delta'] - disc_q,
+            'Gamma': call_greeks['Gamma'],
+            'Theta': (common_theta - q * S * disc_q * (1 - Nd1) + r * K * disc_r * (1 - Nd2)) / 365,
+            'Vega': call_greeks['Vega'],
+            'Rho': -K * T * disc_r * (1 - Nd2) / 100
+        }
+
+    lines.append(f"{'Metric':<15} {'Call Option':<15} {'Put Option':<15}")
+    lines.append("-" * 50)
 
     for metric in ['Price', 'Delta', 'Gamma', 'Theta', 'Vega', 'Rho']:
         call_val = call_greeks[metric]
         put_val = put_greeks[metric]
 
         if metric == 'Price':
-            print(f"{metric:<15} ${call_val:<14.4f} ${put_val:<14.4f}")
+            lines.append(f"{metric:<15} ${call_val:<14.4f} ${put_val:<14.4f}")
         else:
-            print(f"{metric:<15} {call_val:<15.4f} {put_val:<15.4f}")
+            lines.append(f"{metric:<15} {call_val:<15.4f} {put_val:<15.4f}")
 
     # Put-Call Parity Check
-    print(f"\n{'PUT-CALL PARITY CHECK:'}")
-    print(f"Call - Put = {call_greeks['Price'] - put_greeks['Price']:.4f}")
-    print(f"S - K*e^(-rT) = {S - K * np.exp(-r * T):.4f}")
-    print(f"Difference = {abs((call_greeks['Price'] - put_greeks['Price']) - (S - K * np.exp(-r * T))):.6f}")
+    lines.append(f"\n{'PUT-CALL PARITY CHECK:'}")
+    lines.append(f"Call - Put = {call_greeks['Price'] - put_greeks['Price']:.4f}")
+    lines.append(f"S - K*e^(-rT) = {S - K * disc_r:.4f}")
+    lines.append(f"Difference = {abs((call_greeks['Price'] - put_greeks['Price']) - (S - K * disc_r)):.6f}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')